@@ -21,6 +21,10 @@ _DEFAULT_LAYER_ADDR = 0x0000
 _PID_AUX_SOURCE = 0x104A
 _SIGNATURE = 0x0003
 
+# 52-byte subscription packet: header words, payload words, 16 zero bytes,
+# subscription/signature block, PID, then marker + layer address + bus.
+_PACKET = struct.Struct('>4H2I16x4HI2H4B')
+
 
 def build_aux_subscription_packet(
     sequence: int,
@@ -31,27 +35,25 @@ def build_aux_subscription_packet(
     """Return a single AUX source subscription packet (same as aux_monitor_control)."""
 
     bus = max(0, min(95, int(bus_index)))
-    pkt = bytearray(52)
-
-    struct.pack_into('>H', pkt, 0, _PKT_HEADER)
-    struct.pack_into('>H', pkt, 2, sequence & 0xFFFF)
-    struct.pack_into('>H', pkt, 4, _CMD_SUBSCRIBE)
-    struct.pack_into('>H', pkt, 6, _PARAM_SUBSCRIBE)
-    struct.pack_into('>I', pkt, 8, _PAYLOAD_WORDS[0])
-    struct.pack_into('>I', pkt, 12, _PAYLOAD_WORDS[1])
-    struct.pack_into('>H', pkt, 32, subscription_id & 0xFFFF)
-    struct.pack_into('>H', pkt, 34, 0x0001)
-    struct.pack_into('>H', pkt, 36, _SIGNATURE)
-    struct.pack_into('>H', pkt, 38, _SIGNATURE)
-    struct.pack_into('>I', pkt, 40, 0x00000000)
-    struct.pack_into('>H', pkt, 44, _PID_AUX_SOURCE)
-    struct.pack_into('>H', pkt, 46, 0x0000)
-    pkt[48] = 0x19
-    pkt[49] = (layer_address >> 8) & 0xFF
-    pkt[50] = layer_address & 0xFF
-    pkt[51] = bus
-
-    return bytes(pkt)
+    return _PACKET.pack(
+        _PKT_HEADER,
+        sequence & 0xFFFF,
+        _CMD_SUBSCRIBE,
+        _PARAM_SUBSCRIBE,
+        _PAYLOAD_WORDS[0],
+        _PAYLOAD_WORDS[1],
+        subscription_id & 0xFFFF,
+        0x0001,
+        _SIGNATURE,
+        _SIGNATURE,
+        0x00000000,
+        _PID_AUX_SOURCE,
+        0x0000,
+        0x19,
+        (layer_address >> 8) & 0xFF,
+        layer_address & 0xFF,
+        bus,
+    )
 
 
 def build_aux_subscription_sequence(
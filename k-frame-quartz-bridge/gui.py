@@ -3,10 +3,11 @@
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, ttk
 import sys
+import threading
 import webbrowser
 from pathlib import Path
 import configparser
-from license import LicenseManager, LicenseStatus, storage
+from license import LicenseManager, LicenseStatus, load_cached_status, storage
 
 
 SUITES = [
@@ -18,27 +19,60 @@ SUITES = [
 
 PROTOCOLS = ["auto", "tcp", "udp"]
 
+# Oldest log lines are dropped beyond this so the widget doesn't grow forever
+MAX_LOG_LINES = 5000
+
 
 class LogRedirector:
-    """Redirect stdout/stderr to GUI text widget."""
+    """Redirect stdout/stderr to GUI text widget.
+
+    Writes arrive from the bridge thread; they are buffered and flushed to
+    the widget in a single insert per Tk idle cycle.
+    """
 
     def __init__(self, text_widget):
         self.text_widget = text_widget
         self.enabled = True
+        self._pending = []
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self._alive = True
+        text_widget.bind("<Destroy>", self._on_destroy, add="+")
+        # Registered once so each flush schedules an existing Tcl command
+        self._flush_cmd = text_widget.register(self._flush)
+
+    def _on_destroy(self, _event):
+        self._alive = False
 
     def write(self, message):
         if not self.enabled:
             return
+        with self._lock:
+            self._pending.append(message)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
         try:
-            if self.text_widget.winfo_exists():
-                self.text_widget.after(0, self._update_text, message)
+            if self._alive:
+                self.text_widget.tk.call("after", "idle", self._flush_cmd)
+                return
         except Exception:
             pass
-
-    def _update_text(self, message):
+        with self._lock:
+            self._pending.clear()
+            self._flush_scheduled = False
+
+    def _flush(self):
+        with self._lock:
+            messages = self._pending
+            self._pending = []
+            self._flush_scheduled = False
         try:
-            if self.enabled and self.text_widget.winfo_exists():
-                self.text_widget.insert(tk.END, message)
+            if self.enabled and self._alive:
+                self.text_widget.insert(tk.END, "".join(messages))
+                lines = int(self.text_widget.index("end-1c").split(".")[0])
+                if lines > MAX_LOG_LINES:
+                    self.text_widget.delete("1.0", f"{lines - MAX_LOG_LINES + 1}.0")
                 self.text_widget.see(tk.END)
         except Exception:
             pass
@@ -76,8 +110,8 @@ class BridgeGUI:
             except Exception:
                 pass
 
-        self.license_manager = LicenseManager(self.root, self._on_license_status_changed)
-        self.license_manager.ensure_dialog()
+        # Built once the cached license is verified; see _start_license_check
+        self.license_manager = None
 
         self._create_menu()
         self._create_content()
@@ -88,6 +122,29 @@ class BridgeGUI:
         sys.stdout = self.log_redirector
         sys.stderr = self.log_redirector
 
+        # Started from the event loop: the worker hands back via root.after,
+        # which needs mainloop to be running
+        self.root.after_idle(self._start_license_check)
+
+    def _start_license_check(self):
+        """Read and verify the cached license off the Tk thread."""
+        threading.Thread(target=self._license_check_worker, daemon=True).start()
+
+    def _license_check_worker(self):
+        cached = load_cached_status()
+        try:
+            self.root.after(0, self._init_license_manager, cached)
+        except RuntimeError:
+            pass  # Window closed before the check finished
+
+    def _init_license_manager(self, cached):
+        """Build the license manager from the worker's result."""
+        self.license_manager = LicenseManager(
+            self.root, self._on_license_status_changed, load_cached=False
+        )
+        self.license_manager.apply_cached_status(cached)
+        self.license_manager.ensure_dialog()
+
     def _create_menu(self):
         """Create menu bar."""
         menubar = tk.Menu(self.root)
@@ -189,6 +246,7 @@ class BridgeGUI:
             anchor="w",
         )
         self.status_label.pack(side=tk.LEFT, padx=10)
+        self._status_text = "Ready"
 
     def _open_browser(self):
         """Open the status page in default browser."""
@@ -280,6 +338,10 @@ class BridgeGUI:
         button_frame = tk.Frame(container, bg="#1e1e1e")
         button_frame.pack(fill=tk.X, pady=(10, 0))
 
+        def show_error(message):
+            status_var.set(message)
+            status_label.config(fg="#ff5555")
+
         def save_settings():
             try:
                 port_q = int(fields["Quartz Listen Port:"].get())
@@ -288,13 +350,13 @@ class BridgeGUI:
                 dests = int(fields["Router Destinations:"].get())
                 for port in (port_q, port_h):
                     if port < 1 or port > 65535:
-                        messagebox.showerror("Invalid Port", "Ports must be between 1 and 65535")
+                        show_error("Ports must be between 1 and 65535")
                         return
                 if sources < 1 or dests < 1:
-                    messagebox.showerror("Invalid Value", "Sources and destinations must be at least 1")
+                    show_error("Sources and destinations must be at least 1")
                     return
             except ValueError:
-                messagebox.showerror("Invalid Value", "Please enter valid numbers for ports, sources, and destinations")
+                show_error("Please enter valid numbers for ports, sources, and destinations")
                 return
 
             for section in ("gv", "quartz", "http", "router"):
@@ -378,6 +440,9 @@ class BridgeGUI:
 
     def update_status(self, message):
         """Update status bar message."""
+        if message == self._status_text:
+            return
+        self._status_text = message
         self.status_label.config(text=message)
 
     def run(self):
@@ -14,6 +14,10 @@ import signal
 import sys
 from typing import Optional, Callable, List, Tuple
 
+# AUX route command: type, message id, fixed route header, aux index, source, trailer
+_AUX_COMMAND = struct.Struct('>2H19sB2H')
+_AUX_COMMAND_HEADER = bytes.fromhex("000200050000000c00000013007e0000190001")
+
 class GVPluginPersistent:
     """Persistent connection with heartbeat maintenance"""
 
@@ -23,6 +27,7 @@ class GVPluginPersistent:
         suite: str = "suite1a",
         bind_host: str = "127.0.0.1",
         message_callback: Optional[Callable[[bytes], None]] = None,
+        disconnect_callback: Optional[Callable[[], None]] = None,
         protocol: str = "auto",
     ):
         self.target_ip = target_ip
@@ -36,6 +41,7 @@ class GVPluginPersistent:
         self.heartbeat_thread = None
         self.listener_thread = None
         self.message_callback = message_callback
+        self.disconnect_callback = disconnect_callback
         self.protocol_preference = (protocol or "auto").lower()
         self.protocol = None  # "udp" or "tcp"
         self._tcp_buffer = bytearray()
@@ -444,13 +450,8 @@ class GVPluginPersistent:
     def build_aux_command(self, aux_number: int, source_number: int) -> bytes:
         """Build aux command"""
         message_id = random.randint(0, 0xFFFF)
-        message_hex = f"{message_id:04x}"
-        aux_hex = f"{aux_number - 1:02x}"
-        source_hex = f"{source_number:04x}"
-        payload_hex = f"0004{message_hex}000200050000000c00000013007e0000190001{aux_hex}{source_hex}0001"
-
-        print(f"[AUX] Aux {aux_number} -> Source {source_number} (ID: 0x{message_hex})")
-        return bytes.fromhex(payload_hex)
+        print(f"[AUX] Aux {aux_number} -> Source {source_number} (ID: 0x{message_id:04x})")
+        return _AUX_COMMAND.pack(0x0004, message_id, _AUX_COMMAND_HEADER, aux_number - 1, source_number, 0x0001)
 
     def send_aux_command(self, aux_number: int, source_number: int) -> bool:
         """Send aux command"""
@@ -534,8 +535,15 @@ class GVPluginPersistent:
                         print(f"[Heartbeat] Error: {e}")
                     break
         finally:
+            # Still running means the link dropped rather than disconnect() being called
+            link_lost = self.running
             self.connected = False
             self.running = False
+            if link_lost and self.disconnect_callback:
+                try:
+                    self.disconnect_callback()
+                except Exception as callback_error:
+                    print(f"[Heartbeat] Disconnect callback error: {callback_error}")
 
     def _listener_receive_loop(self):
         """Listener socket receive thread (UDP only).
@@ -26,7 +26,7 @@ import signal
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from gv_plugin_persistent import GVPluginPersistent
 from aux_subscriptions import build_aux_subscription_sequence
@@ -63,7 +63,7 @@ class HTTPConfig:
     listen_port: int = 4001
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandRecord:
     timestamp: datetime
     level: str
@@ -99,8 +99,11 @@ class BridgeState:
     command_log: List[CommandRecord] = field(default_factory=list)
     max_log: int = 50
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Bumped on every mutation so readers can tell when cached views are stale
+    version: int = 0
 
     def set_gv_connected(self, connected: bool, working_port: Optional[int] = None) -> None:
+        self.version += 1
         self.gv_connected = connected
         if working_port is not None:
             self.gv_working_port = working_port
@@ -108,13 +111,16 @@ class BridgeState:
             self.last_error = None
 
     def set_gv_error(self, message: str) -> None:
+        self.version += 1
         self.last_error = message
         self.gv_connected = False
 
     def add_client(self, peer: str) -> None:
+        self.version += 1
         self.clients[peer] = datetime.now(timezone.utc)
 
     def remove_client(self, peer: str) -> None:
+        self.version += 1
         self.clients.pop(peer, None)
 
     def record_route(
@@ -126,6 +132,7 @@ class BridgeState:
         gv_source: int,
         status: str,
     ) -> None:
+        self.version += 1
         record = CommandRecord(
             timestamp=datetime.now(timezone.utc),
             level=level,
@@ -137,7 +144,7 @@ class BridgeState:
         )
         self.command_log.append(record)
         if len(self.command_log) > self.max_log:
-            self.command_log = self.command_log[-self.max_log :]
+            del self.command_log[: -self.max_log]
 
         if status == "ok":
             self.routes.setdefault(level, {})[dest] = source
@@ -244,11 +251,20 @@ class GVSwitchController:
             cfg.suite,
             bind_host=cfg.bind_host,
             message_callback=self._handle_plugin_message,
+            disconnect_callback=self._handle_plugin_disconnect,
             protocol=cfg.protocol,
         )
         self._lock = asyncio.Lock()
         self._connected = False
         self._subscribed = False
+        self._link_lost = asyncio.Event()
+        # Reverse lookups for GV AUX updates; the first mapping wins, as before
+        self._source_by_input: Dict[int, int] = {}
+        for quartz_source, mapped in state.source_to_input.items():
+            self._source_by_input.setdefault(mapped, quartz_source)
+        self._dest_by_aux: Dict[int, int] = {}
+        for quartz_dest, mapped_aux in state.dest_to_aux.items():
+            self._dest_by_aux.setdefault(mapped_aux, quartz_dest)
         aux_base_count = self.router_cfg.destinations or len(state.dest_to_aux) or 96
         dest_aux_values = self._compute_dest_aux_values(aux_base_count)
 
@@ -339,6 +355,10 @@ class GVSwitchController:
         if self.loop:
             self.loop.call_soon_threadsafe(self._process_plugin_message, payload)
 
+    def _handle_plugin_disconnect(self) -> None:
+        if self.loop:
+            self.loop.call_soon_threadsafe(self._link_lost.set)
+
     def _process_plugin_message(self, payload: bytes) -> None:
         """Parse one or more subscription response blocks from a GV message.
 
@@ -406,16 +426,10 @@ class GVSwitchController:
         self.state.record_route('V', quartz_dest, quartz_source, aux_number, gv_source, 'ok')
 
     def _unmap_source(self, gv_source: int) -> int:
-        for quartz_source, mapped in self.state.source_to_input.items():
-            if mapped == gv_source:
-                return quartz_source
-        return gv_source
+        return self._source_by_input.get(gv_source, gv_source)
 
     def _unmap_dest(self, aux: int) -> int:
-        for quartz_dest, mapped_aux in self.state.dest_to_aux.items():
-            if mapped_aux == aux:
-                return quartz_dest
-        return aux
+        return self._dest_by_aux.get(aux, aux)
 
     async def close(self) -> None:
         if not self._connected:
@@ -445,6 +459,8 @@ class GVSwitchController:
     async def reconnection_loop(self, stop_event: asyncio.Event) -> None:
         """Background task that monitors connection health and reconnects.
 
+        Wakes as soon as the plugin reports a lost link; the periodic check
+        remains as a fallback for failures seen only by the controller.
         Exponential backoff: 5s -> 10s -> 20s -> 40s -> 60s cap.
         Resets to 5s after a successful reconnection.
         """
@@ -455,11 +471,10 @@ class GVSwitchController:
         delay = INITIAL_DELAY
 
         while not stop_event.is_set():
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=CHECK_INTERVAL)
+            await self._wait_for_link_change(stop_event, CHECK_INTERVAL)
+            if stop_event.is_set():
                 break
-            except asyncio.TimeoutError:
-                pass
+            self._link_lost.clear()
 
             if self._connected and self.plugin.connected:
                 delay = INITIAL_DELAY
@@ -488,6 +503,17 @@ class GVSwitchController:
 
         logger.info("Reconnection loop stopped")
 
+    async def _wait_for_link_change(self, stop_event: asyncio.Event, timeout: float) -> None:
+        waiters = {
+            asyncio.ensure_future(stop_event.wait()),
+            asyncio.ensure_future(self._link_lost.wait()),
+        }
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
 
 class QuartzRouterServer:
     """Implements a minimal Quartz ASCII router server."""
@@ -504,6 +530,7 @@ class QuartzRouterServer:
     }
 
     LEVEL_RESPONSES = {
+        2: ['.ALV2,V,A1-A32', '.ALV10,V,A33-A64', '.ALV18,V,A65-A96', '.A'],
         10: ['.ALV10,V,A33-A64', '.A'],
         18: ['.ALV18,V,A65-A96', '.A'],
     }
@@ -532,6 +559,18 @@ class QuartzRouterServer:
             return mapped
         return source
 
+    def _route_in_range(self, dest: int, source: int, label: str) -> bool:
+        max_dest = self.cfg.router.destinations or 96
+        if dest < 1 or dest > max_dest:
+            logger.warning("%s rejected: dest %d out of range (1-%d)", label, dest, max_dest)
+            return False
+
+        max_src = self.cfg.router.sources or 0
+        if max_src and (source < 1 or source > max_src):
+            logger.warning("%s rejected: source %d out of range (1-%d)", label, source, max_src)
+            return False
+        return True
+
     def _respond(self, responses: List[str]) -> List[str]:
         logger.debug("Responding with: %s", responses)
         return responses
@@ -607,7 +646,7 @@ class QuartzRouterServer:
         logger.debug("Received command: %s", command)
 
         if command.startswith('.X,'):
-            tokens = [token.strip().upper() for token in command[3:].split(',') if token.strip()]
+            tokens = [token for token in map(str.strip, command[3:].upper().split(',')) if token]
             if not tokens:
                 return self._respond(['.XA,QCX,NONE,NO'])
 
@@ -644,14 +683,7 @@ class QuartzRouterServer:
             source = int(source_str)
             logger.info("Status vector update: level=%s dest=%s source=%s", level_char, dest, source)
 
-            max_dest = self.cfg.router.destinations or 96
-            if dest < 1 or dest > max_dest:
-                logger.warning("Vector update rejected: dest %d out of range (1-%d)", dest, max_dest)
-                return self._respond([".NA"])
-
-            max_src = self.cfg.router.sources or 0
-            if max_src and (source < 1 or source > max_src):
-                logger.warning("Vector update rejected: source %d out of range (1-%d)", source, max_src)
+            if not self._route_in_range(dest, source, "Vector update"):
                 return self._respond([".NA"])
 
             aux = self.cfg.mappings.dest_to_aux.get(dest, dest)
@@ -684,14 +716,7 @@ class QuartzRouterServer:
             source = int(source_str)
             logger.info("Route request: level=%s dest=%s source=%s", level, dest, source)
 
-            max_dest = self.cfg.router.destinations or 96
-            if dest < 1 or dest > max_dest:
-                logger.warning("Route rejected: dest %d out of range (1-%d)", dest, max_dest)
-                return self._respond([".NA"])
-
-            max_src = self.cfg.router.sources or 0
-            if max_src and (source < 1 or source > max_src):
-                logger.warning("Route rejected: source %d out of range (1-%d)", source, max_src)
+            if not self._route_in_range(dest, source, "Route"):
                 return self._respond([".NA"])
 
             aux = self.cfg.mappings.dest_to_aux.get(dest, dest)
@@ -720,13 +745,6 @@ class QuartzRouterServer:
         if match:
             level_index = int(match.group(1))
             logger.info("Level info request: level_index=%s", level_index)
-            if level_index == 2:
-                return self._respond([
-                    '.ALV2,V,A1-A32',
-                    '.ALV10,V,A33-A64',
-                    '.ALV18,V,A65-A96',
-                    '.A'
-                ])
             response = self.LEVEL_RESPONSES.get(level_index)
             if response:
                 return self._respond(response)
@@ -740,10 +758,11 @@ class QuartzRouterServer:
             logger.info("List request: level=%s start_dest=%s criteria=%s", level, start_dest, criteria)
             results: List[str] = []
             max_dest = self.cfg.router.destinations or max(self.state.dest_to_aux.keys() or [start_dest])
+            level_routes = self.routes.get(level, {})
             if criteria in ('', '-'):
                 dest = start_dest
                 while len(results) < 8 and dest <= max_dest:
-                    current = self.routes.get(level, {}).get(dest, 0)
+                    current = level_routes.get(dest, 0)
                     results.append(f"{level}{dest:03d},{current:03d}")
                     dest += 1
             else:
@@ -753,7 +772,7 @@ class QuartzRouterServer:
                     target_source = -1
                 dest = start_dest
                 while len(results) < 8 and dest <= max_dest:
-                    current = self.routes.get(level, {}).get(dest, 0)
+                    current = level_routes.get(dest, 0)
                     if current == target_source:
                         results.append(f"{level}{dest:03d},{current:03d}")
                     dest += 1
@@ -836,6 +855,10 @@ class StatusHTTPServer:
         self.cfg = cfg
         self.state = state
         self.server: Optional[asyncio.AbstractServer] = None
+        # The status page is static (it polls /health), so encode it once
+        self._status_page = self._render_status_page().encode("utf-8")
+        self._health_body_version = -1
+        self._health_body = b""
 
     async def start(self) -> None:
         if self.server:
@@ -878,20 +901,24 @@ class StatusHTTPServer:
                 return
 
             if path.startswith("/health"):
-                body = json.dumps(self._build_health_snapshot(), indent=2)
-                await self._write_response(writer, "200 OK", "application/json", body)
+                await self._write_response(writer, "200 OK", "application/json", self._health_json())
                 return
 
-            body = self._render_status_page()
-            await self._write_response(writer, "200 OK", "text/html; charset=utf-8", body)
+            await self._write_response(writer, "200 OK", "text/html; charset=utf-8", self._status_page)
 
         finally:
             writer.close()
             with contextlib.suppress(Exception):
                 await writer.wait_closed()
 
-    async def _write_response(self, writer: asyncio.StreamWriter, status: str, content_type: str, body: str) -> None:
-        body_bytes = body.encode("utf-8")
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status: str,
+        content_type: str,
+        body: Union[str, bytes],
+    ) -> None:
+        body_bytes = body if isinstance(body, bytes) else body.encode("utf-8")
         headers = (
             f"HTTP/1.1 {status}\r\n"
             f"Content-Type: {content_type}\r\n"
@@ -903,6 +930,12 @@ class StatusHTTPServer:
         writer.write(headers + body_bytes)
         await writer.drain()
 
+    def _health_json(self) -> bytes:
+        if self._health_body_version != self.state.version:
+            self._health_body = json.dumps(self._build_health_snapshot(), indent=2).encode("utf-8")
+            self._health_body_version = self.state.version
+        return self._health_body
+
     def _build_health_snapshot(self) -> Dict[str, object]:
         clients = [
             {
@@ -1021,6 +1054,7 @@ function dur(iso) {
 }
 
 let prevRoutes = "";
+let prevCmds = "";
 
 async function refresh() {
   try {
@@ -1068,42 +1102,51 @@ async function refresh() {
     const changed = routeSig !== prevRoutes;
     prevRoutes = routeSig;
 
-    if (!routeEntries.length) {
-      rb.innerHTML = '<tr><td colspan="7" class="empty">No routes recorded yet.</td></tr>';
-    } else {
-      let h = "";
-      routeEntries.forEach(([level, dest, info]) => {
-        const dl = "AUX" + String(dest);
-        const sl = "SRC" + String(info.source).padStart(3, "0");
-        h += "<tr" + (changed ? ' class="pulse"' : "") + ">" +
-          "<td>" + esc(level) + "</td>" +
-          "<td>" + dest + "</td>" +
-          "<td>" + info.aux + "</td>" +
-          "<td>" + esc(dl) + "</td>" +
-          "<td>" + info.source + "</td>" +
-          "<td>" + info.gv_source + "</td>" +
-          "<td>" + esc(sl) + "</td></tr>";
-      });
-      rb.innerHTML = h;
+    // Leave the previous rows in place unless the route set changed
+    if (changed) {
+      if (!routeEntries.length) {
+        rb.innerHTML = '<tr><td colspan="7" class="empty">No routes recorded yet.</td></tr>';
+      } else {
+        let h = "";
+        routeEntries.forEach(([level, dest, info]) => {
+          const dl = "AUX" + String(dest);
+          const sl = "SRC" + String(info.source).padStart(3, "0");
+          h += '<tr class="pulse">' +
+            "<td>" + esc(level) + "</td>" +
+            "<td>" + dest + "</td>" +
+            "<td>" + info.aux + "</td>" +
+            "<td>" + esc(dl) + "</td>" +
+            "<td>" + info.source + "</td>" +
+            "<td>" + info.gv_source + "</td>" +
+            "<td>" + esc(sl) + "</td></tr>";
+        });
+        rb.innerHTML = h;
+      }
     }
 
     // Commands
     const cmb = document.getElementById("cmdsBody");
-    if (!d.recent_commands || !d.recent_commands.length) {
-      cmb.innerHTML = '<tr><td colspan="7" class="empty">No commands processed.</td></tr>';
-    } else {
-      let h = "";
-      d.recent_commands.forEach(c => {
-        const cls = c.status === "ok" ? "ok-text" : "warn-text";
-        h += "<tr><td>" + fmt(c.timestamp) + "</td>" +
-          "<td>" + esc(c.level) + "</td>" +
-          "<td>" + c.destination + "</td>" +
-          "<td>" + c.aux + "</td>" +
-          "<td>" + c.source + "</td>" +
-          "<td>" + c.gv_source + "</td>" +
-          "<td class='" + cls + "'>" + esc(c.status) + "</td></tr>";
-      });
-      cmb.innerHTML = h;
+    // Same as routes: rebuild only when the (at most 20) records differ
+    const cmds = d.recent_commands || [];
+    const cmdsSig = JSON.stringify(cmds);
+    if (cmdsSig !== prevCmds) {
+      prevCmds = cmdsSig;
+      if (!cmds.length) {
+        cmb.innerHTML = '<tr><td colspan="7" class="empty">No commands processed.</td></tr>';
+      } else {
+        let h = "";
+        cmds.forEach(c => {
+          const cls = c.status === "ok" ? "ok-text" : "warn-text";
+          h += "<tr><td>" + fmt(c.timestamp) + "</td>" +
+            "<td>" + esc(c.level) + "</td>" +
+            "<td>" + c.destination + "</td>" +
+            "<td>" + c.aux + "</td>" +
+            "<td>" + c.source + "</td>" +
+            "<td>" + c.gv_source + "</td>" +
+            "<td class='" + cls + "'>" + esc(c.status) + "</td></tr>";
+        });
+        cmb.innerHTML = h;
+      }
     }
   } catch (e) { console.error("Refresh failed:", e); }
 }
@@ -1,11 +1,12 @@
 """Licensing utilities for the K-Frame Quartz Control application."""
 
-from .dialog import LicenseManager, LicenseStatus
+from .dialog import LicenseManager, LicenseStatus, load_cached_status
 from . import storage
 
 __all__ = [
     "LicenseManager",
     "LicenseStatus",
+    "load_cached_status",
     "storage",
 ]
 
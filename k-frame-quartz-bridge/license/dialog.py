@@ -23,6 +23,20 @@ class LicenseStatus:
 StatusCallback = Callable[[LicenseStatus], None]
 
 
+def load_cached_status(storage_path: Optional[Path] = None) -> Optional[LicenseStatus]:
+    """Read and verify the cached license without touching Tk.
+
+    Safe to call from a worker thread; returns None when nothing is cached.
+    """
+    cached = storage.load_cached_license(storage_path)
+    if not cached:
+        return None
+    name = cached.get("name", "")
+    key = cached.get("key", "")
+    ok, reason = verification.verify_name_key(name, key)
+    return LicenseStatus(ok=ok, reason=reason, name=name, key=key)
+
+
 class LicenseManager:
     """Manage license verification, persistence, and dialog presentation."""
 
@@ -32,6 +46,7 @@ class LicenseManager:
         on_status_change: Optional[StatusCallback] = None,
         *,
         storage_path: Optional[Path] = None,
+        load_cached: bool = True,
     ) -> None:
         self.root = root
         self._on_status_change = on_status_change
@@ -43,26 +58,24 @@ class LicenseManager:
         self._status_var = tk.StringVar(value="License required")
         self._status_color = "#ff5555"
         self.status = LicenseStatus(ok=False, reason="License required")
-        self._load_cached_license()
+        if load_cached:
+            self.apply_cached_status(load_cached_status(storage_path))
 
-    def _load_cached_license(self) -> None:
-        cached = storage.load_cached_license(self._storage_path)
+    def apply_cached_status(self, cached: Optional[LicenseStatus]) -> None:
+        """Adopt a result from load_cached_status; call on the Tk thread."""
         if not cached:
             self._emit_status()
             return
-        name = cached.get("name", "")
-        key = cached.get("key", "")
-        if name:
-            self._name_var.set(name)
-        if key:
-            self._key_var.set(key)
-        ok, reason = verification.verify_name_key(name, key)
-        self.status = LicenseStatus(ok=ok, reason=reason, name=name, key=key)
-        if ok:
+        if cached.name:
+            self._name_var.set(cached.name)
+        if cached.key:
+            self._key_var.set(cached.key)
+        self.status = cached
+        if cached.ok:
             self._status_var.set("License validated")
             self._status_color = "#4CAF50"
         else:
-            self._status_var.set(reason)
+            self._status_var.set(cached.reason)
             self._status_color = "#ff5555"
         self._emit_status()
 
@@ -183,17 +196,27 @@ class LicenseManager:
             self._on_status_change(self.status)
 
     def _update_status_color(self, color: str) -> None:
+        # The label is created with _status_color, so an equal colour is already shown
+        if color == self._status_color:
+            return
         self._status_color = color
         if self._status_widget and self._status_widget.winfo_exists():
             self._status_widget.config(fg=color)
 
-    def _set_status(self, ok: bool, reason: str, name: Optional[str] = None, key: Optional[str] = None) -> None:
+    def _set_status(
+        self,
+        ok: bool,
+        reason: str,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        message: Optional[str] = None,
+    ) -> None:
         if name is not None:
             self._name_var.set(name)
         if key is not None:
             self._key_var.set(key)
         self.status = LicenseStatus(ok=ok, reason=reason, name=self._name_var.get(), key=self._key_var.get())
-        self._status_var.set(reason)
+        self._status_var.set(message or reason)
         self._update_status_color("#4CAF50" if ok else "#ff5555")
         self._emit_status()
 
@@ -204,11 +227,9 @@ class LicenseManager:
             messagebox.showerror("License", "Enter both a name and license key")
             return
         ok, reason = verification.verify_name_key(name, key)
-        self._set_status(ok, reason, name, key)
+        self._set_status(ok, reason, name, key, message="License validated" if ok else None)
         if ok:
             storage.save_license(name, key, self._storage_path)
-            self._status_var.set("License validated")
-            self._update_status_color("#4CAF50")
             if self._dialog and self._dialog.winfo_exists():
                 self._dialog.after(400, self._dialog.destroy)
 
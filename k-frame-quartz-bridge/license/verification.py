@@ -6,7 +6,7 @@ import base64
 import json
 import time
 from functools import lru_cache
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
 import importlib.resources as resources
 from nacl.exceptions import BadSignatureError
@@ -34,6 +34,23 @@ def load_public_key() -> bytes:
     return data
 
 
+@lru_cache(maxsize=32)
+def _verified_payload(entered_key: str) -> Dict[str, Any]:
+    """Return the signed payload of a well-formed key.
+
+    Raises BadSignatureError when the signature does not match. Results are
+    cached per key; name and expiry checks are left to the caller.
+    """
+    parts = entered_key.split(".")
+    payload_bytes = _b64u_decode(parts[0])
+    signature_bytes = _b64u_decode(parts[1])
+
+    public_key = load_public_key()
+    VerifyKey(public_key).verify(payload_bytes, signature_bytes)
+
+    return json.loads(payload_bytes.decode("utf-8"))
+
+
 def verify_name_key(
     entered_name: str,
     entered_key: str,
@@ -41,17 +58,11 @@ def verify_name_key(
 ) -> Tuple[bool, str]:
     """Validate the license tuple and return (ok, reason)."""
     try:
+        # Only the structural checks: the decoder is lenient about alphabet and padding
         parts = entered_key.split(".")
-        if len(parts) != 2:
+        if len(parts) != 2 or not parts[0] or not parts[1]:
             return False, "Malformed key"
-
-        payload_bytes = _b64u_decode(parts[0])
-        signature_bytes = _b64u_decode(parts[1])
-
-        public_key = load_public_key()
-        VerifyKey(public_key).verify(payload_bytes, signature_bytes)
-
-        payload = json.loads(payload_bytes.decode("utf-8"))
+        payload = _verified_payload(entered_key)
 
         if expected_product and payload.get("product") != expected_product:
             return False, "Wrong product"
@@ -69,4 +80,3 @@ def verify_name_key(
         return False, "Invalid signature"
     except Exception as exc:  # pragma: no cover - defensive branch
         return False, f"Error: {exc}"
-
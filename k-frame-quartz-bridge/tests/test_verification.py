@@ -0,0 +1,74 @@
+"""Tests for license key verification."""
+
+import base64
+import json
+import time
+import unittest
+from unittest import mock
+
+from nacl.signing import SigningKey
+
+from license import verification
+
+SIGNING_KEY = SigningKey(bytes(range(32)))
+
+
+def _sign(payload, encode):
+    payload_bytes = json.dumps(payload).encode("utf-8")
+    signature = SIGNING_KEY.sign(payload_bytes).signature
+    return f"{encode(payload_bytes).decode()}.{encode(signature).decode()}"
+
+
+def _urlsafe(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+class VerifyNameKeyTests(unittest.TestCase):
+    def setUp(self):
+        verification._verified_payload.cache_clear()
+        patcher = mock.patch.object(
+            verification, "load_public_key", return_value=bytes(SIGNING_KEY.verify_key)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(verification._verified_payload.cache_clear)
+
+    def _payload(self, **extra):
+        payload = {"name": "Studio A", "product": verification.DEFAULT_PRODUCT}
+        payload.update(extra)
+        return payload
+
+    def test_urlsafe_key_is_accepted(self):
+        key = _sign(self._payload(), _urlsafe)
+        self.assertEqual(verification.verify_name_key("studio  a", key), (True, "OK"))
+
+    def test_standard_alphabet_key_is_accepted(self):
+        # Keys stored with the +/ alphabet and padding have always validated
+        for serial in range(100):
+            key = _sign(self._payload(serial=serial), base64.b64encode)
+            if "+" in key or "/" in key:
+                break
+        else:
+            self.fail("no signature with '+' or '/' in 100 attempts")
+        self.assertEqual(verification.verify_name_key("Studio A", key), (True, "OK"))
+
+    def test_malformed_keys_are_rejected(self):
+        for key in ("", "abc", "a.b.c", ".abc", "abc."):
+            with self.subTest(key=key):
+                self.assertEqual(verification.verify_name_key("Studio A", key), (False, "Malformed key"))
+
+    def test_tampered_payload_is_rejected(self):
+        key = _sign(self._payload(), _urlsafe)
+        forged = _urlsafe(json.dumps(self._payload(name="Studio B")).encode("utf-8")).decode()
+        key = f"{forged}.{key.split('.')[1]}"
+        self.assertEqual(verification.verify_name_key("Studio B", key), (False, "Invalid signature"))
+
+    def test_expiry_is_checked_on_cached_keys(self):
+        key = _sign(self._payload(exp=int(time.time()) + 60), _urlsafe)
+        self.assertEqual(verification.verify_name_key("Studio A", key), (True, "OK"))
+        with mock.patch.object(verification.time, "time", return_value=time.time() + 120):
+            self.assertEqual(verification.verify_name_key("Studio A", key), (False, "License expired"))
+
+
+if __name__ == "__main__":
+    unittest.main()